@@ -24,6 +24,7 @@
 # In[2]:
 
 import pandas as pd
+import os
 
 
 # ## Import TSV
@@ -50,9 +51,21 @@ html_escape_table = {
     "'": "&apos;"
     }
 
+#translation table built once so escaping is a single str.translate call
+html_escape_trans = str.maketrans(html_escape_table)
+
 def html_escape(text):
     """Produce entities within text."""
-    return "".join(html_escape_table.get(c,c) for c in text)
+    return text.translate(html_escape_trans)
+
+def write_if_changed(path, text):
+    """Write text to path unless the file already holds exactly that text."""
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            if f.read() == text:
+                return
+    with open(path, 'w') as f:
+        f.write(text)
 
 
 # ## Creating the markdown files
@@ -61,7 +74,6 @@ def html_escape(text):
 
 # In[5]:
 
-import os
 for row, item in publications.iterrows():
     
     md_filename = str(item.pub_date) + "-" + item.url_slug + ".md"
@@ -102,7 +114,6 @@ for row, item in publications.iterrows():
     
     md_filename = os.path.basename(md_filename)
        
-    with open("../_publications/" + md_filename, 'w') as f:
-        f.write(md)
+    write_if_changed("../_publications/" + md_filename, md)
 
 
@@ -49,9 +49,27 @@ html_escape_table = {
     "'": "&apos;"
     }
 
+#translation table built once so escaping is a single str.translate call
+html_escape_trans = str.maketrans(html_escape_table)
+
 def html_escape(text):
     """Produce entities within text."""
-    return "".join(html_escape_table.get(c,c) for c in text)
+    return text.translate(html_escape_trans)
+
+def write_if_changed(path, text):
+    """Write text to path unless the file already holds exactly that text."""
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            if f.read() == text:
+                return
+    with open(path, 'w') as f:
+        f.write(text)
+
+#bibtex formatting characters ({, } and \) stripped from titles and venues in a single pass
+bibtex_strip_table = str.maketrans("", "", "{}\\")
+
+#characters that are dropped when building url slugs, compiled once for all entries
+url_slug_pattern = re.compile("\\[.*\\]|[^a-zA-Z0-9_-]")
 
 
 for pubsource in publist:
@@ -87,33 +105,35 @@ for pubsource in publist:
             pub_date = pub_year+"-"+pub_month+"-"+pub_day
             
             #strip out {} as needed (some bibtex entries that maintain formatting)
-            clean_title = b["title"].replace("{", "").replace("}","").replace("\\","").replace(" ","-")    
+            #done once per entry, the stripped title is reused for the slug, citation and YAML
+            stripped_title = b["title"].translate(bibtex_strip_table)
+            escaped_title = html_escape(stripped_title)
+            clean_title = stripped_title.replace(" ","-")    
 
-            url_slug = re.sub("\\[.*\\]|[^a-zA-Z0-9_-]", "", clean_title)
+            url_slug = url_slug_pattern.sub("", clean_title)
             url_slug = url_slug.replace("--","-")
 
             md_filename = (str(pub_date) + "-" + url_slug + ".md").replace("--","-")
             html_filename = (str(pub_date) + "-" + url_slug).replace("--","-")
 
             #Build Citation from text
-            citation = ""
-
             #citation authors - todo - add highlighting for primary author?
-            for author in bibdata.entries[bib_id].persons["author"]:
-                citation = citation+" "+author.first_names[0]+" "+author.last_names[0]+", "
+            #joined in one go instead of growing the string once per author
+            citation = "".join(" "+author.first_names[0]+" "+author.last_names[0]+", "
+                               for author in bibdata.entries[bib_id].persons["author"])
 
             #citation title
-            citation = citation + "\"" + html_escape(b["title"].replace("{", "").replace("}","").replace("\\","")) + ".\""
+            citation = citation + "\"" + escaped_title + ".\""
 
             #add venue logic depending on citation type
-            venue = publist[pubsource]["venue-pretext"]+b[publist[pubsource]["venuekey"]].replace("{", "").replace("}","").replace("\\","")
+            venue = publist[pubsource]["venue-pretext"]+b[publist[pubsource]["venuekey"]].translate(bibtex_strip_table)
 
             citation = citation + " " + html_escape(venue)
             citation = citation + ", " + pub_year + "."
 
             
             ## YAML variables
-            md = "---\ntitle: \""   + html_escape(b["title"].replace("{", "").replace("}","").replace("\\","")) + '"\n'
+            md = "---\ntitle: \""   + escaped_title + '"\n'
             
             md += """collection: """ +  publist[pubsource]["collection"]["name"]
 
@@ -151,8 +171,7 @@ for pubsource in publist:
 
             md_filename = os.path.basename(md_filename)
 
-            with open("../_publications/" + md_filename, 'w') as f:
-                f.write(md)
+            write_if_changed("../_publications/" + md_filename, md)
             print(f'SUCESSFULLY PARSED {bib_id}: \"', b["title"][:60],"..."*(len(b['title'])>60),"\"")
         # field may not exist for a reference
         except KeyError as e:
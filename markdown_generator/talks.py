@@ -49,13 +49,26 @@ html_escape_table = {
     "'": "&apos;"
     }
 
+#translation table built once so escaping is a single str.translate call
+html_escape_trans = str.maketrans(html_escape_table)
+
 def html_escape(text):
     if type(text) is str:
-        return "".join(html_escape_table.get(c,c) for c in text)
+        return text.translate(html_escape_trans)
     else:
         return "False"
 
 
+def write_if_changed(path, text):
+    """Write text to path unless the file already holds exactly that text."""
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            if f.read() == text:
+                return
+    with open(path, 'w') as f:
+        f.write(text)
+
+
 # ## Creating the markdown files
 # 
 # This is where the heavy lifting is done. This loops through all the rows in the TSV dataframe, then starts to concatentate a big string (```md```) that contains the markdown for each type. It does the YAML metadata first, then does the description for the individual page.
@@ -103,8 +116,7 @@ for row, item in talks.iterrows():
     md_filename = os.path.basename(md_filename)
     #print(md)
     
-    with open("../_talks/" + md_filename, 'w') as f:
-        f.write(md)
+    write_if_changed("../_talks/" + md_filename, md)
 
 
 # These files are in the talks directory, one directory below where we're working from.
@@ -14,11 +14,16 @@
 import glob
 import getorg
 from geopy import Nominatim
+from geopy.extra.rate_limiter import RateLimiter
 
 g = glob.glob("*.md")
 
 
-geocoder = Nominatim()
+# bound every lookup and retry transient failures (Nominatim throttles at 1 req/s);
+# a location that still fails after the retries stops the run instead of being dropped
+geocoder = Nominatim(timeout=10)
+geocode = RateLimiter(geocoder.geocode, min_delay_seconds=1, max_retries=3,
+                      error_wait_seconds=5.0, swallow_exceptions=False)
 location_dict = {}
 location = ""
 permalink = ""
@@ -34,8 +39,11 @@ for file in g:
             loc_end = lines_trim.find('"')
             location = lines_trim[:loc_end]
                             
-           
-        location_dict[location] = geocoder.geocode(location)
+        # several talks usually share a venue; only geocode each place once
+        if location in location_dict:
+            continue
+
+        location_dict[location] = geocode(location)
         print(location, "\n", location_dict[location])
 
 